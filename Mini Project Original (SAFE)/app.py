@@ -1,43 +1,258 @@
 # app.py
+import atexit
+import errno
+import glob
+import hashlib
+import hmac
+import io
+import mimetypes
 import os
+import queue
+import re
+import shutil
 import sqlite3
-from flask import Flask, render_template, request, jsonify, send_from_directory, session, redirect, url_for
+import string
+import tempfile
+import threading
+import time
+from flask import Flask, render_template, request, jsonify, send_from_directory, session, redirect, url_for, g, abort
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.security import check_password_hash, generate_password_hash, safe_join
 from werkzeug.utils import secure_filename
 from datetime import datetime
-from functools import wraps
+from urllib.parse import quote
+from contextlib import contextmanager
+from functools import lru_cache, wraps
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+
+try:
+    import orjson
+except ImportError:  # optional; Flask's stdlib json provider is used without it
+    orjson = None
+
+try:
+    import fcntl
+except ImportError:  # not on Windows, where the dev server runs a single process anyway
+    fcntl = None
 
 # Initialize the Flask application
 app = Flask(__name__)
 app.config['UPLOAD_FOLDER'] = 'static/uploads'
+os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
 app.config['MAX_CONTENT_LENGTH'] = 5 * 1024 * 1024  # 5MB limit
 app.config['SECRET_KEY'] = 'college_vehicle_auth_2024_secure_key'
+# Let the front-end server send uploaded images instead of streaming them through Python.
+# USE_X_SENDFILE=1 for Apache mod_xsendfile / lighttpd. For nginx, set X_ACCEL_REDIRECT_PREFIX
+# to an internal location aliased to the upload folder, e.g.
+#     location /protected_uploads/ { internal; alias /srv/app/static/uploads/; }
+app.config['USE_X_SENDFILE'] = os.environ.get('USE_X_SENDFILE') == '1'
+app.config['X_ACCEL_REDIRECT_PREFIX'] = os.environ.get('X_ACCEL_REDIRECT_PREFIX')
+
+# --- JSON Encoding ---
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    JSON provider backed by orjson; output matches the default provider (sorted keys,
+    compact unless debugging). Calls with stdlib json kwargs are passed through unchanged.
+    """
+
+    def _option(self):
+        option = orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def dumps(self, obj, **kwargs):
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_SORT_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=self._option())
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+
+# All tables (images, users, vehicles) live in one database file
+DB_PATH = 'app.db'
+# Per-table databases used by earlier versions; imported into DB_PATH once, then removed
+LEGACY_DB_PATHS = {'images': 'vehicles.db', 'users': 'auth.db', 'vehicles': 'vehicle.db'}
+
+# Max pooled connections per database; should match the WSGI worker thread count.
+DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', 16))
+
+# Per-connection tuning; journal_mode=WAL is persistent and only needs setting once per file
+DB_PRAGMAS = (
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA cache_size=-20000',
+    'PRAGMA mmap_size=268435456',
+)
+
+# --- Hot-path SQL ---
+# Kept as constants so every call reuses the connection's prepared-statement cache
+SQL_SELECT_USER = 'SELECT id, username, full_name, role, password_hash FROM users WHERE username = ?'
+SQL_SELECT_VEHICLES_IN = 'SELECT plate, owner, is_authorized FROM vehicles WHERE plate IN ({})'
+SQL_INSERT_IMAGE = 'INSERT INTO images (filename, upload_time, plate, is_authorized) VALUES (?, ?, ?, ?)'
+SQL_SELECT_IMAGES = ('SELECT filename, upload_time, plate, is_authorized, id FROM images '
+                     'ORDER BY upload_time DESC, id DESC LIMIT ?')
+SQL_SELECT_IMAGES_BEFORE = ('SELECT filename, upload_time, plate, is_authorized, id FROM images '
+                            'WHERE (upload_time, id) < (?, ?) ORDER BY upload_time DESC, id DESC LIMIT ?')
+SQL_IMAGE_STATS = 'SELECT COUNT(*), COALESCE(SUM(is_authorized), 0) FROM images'
+SQL_IMAGES_MAX_ID = 'SELECT MAX(id) FROM images'
+
+SQL_STATEMENT_CACHE_SIZE = 128
+
+def connect_db(db_path, **kwargs):
+    conn = sqlite3.connect(db_path, cached_statements=SQL_STATEMENT_CACHE_SIZE, **kwargs)
+    for pragma in DB_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+# --- Connection Pool ---
+_db_pools = {}
+_db_pools_lock = threading.Lock()
+
+def _get_pool(db_path):
+    with _db_pools_lock:
+        pool = _db_pools.get(db_path)
+        if pool is None:
+            # Slots start empty (None) and are filled with real connections on first use
+            pool = queue.Queue(maxsize=DB_POOL_SIZE)
+            for _ in range(DB_POOL_SIZE):
+                pool.put(None)
+            _db_pools[db_path] = pool
+        return pool
+
+def get_conn(db_path):
+    """
+    Return a pooled connection for db_path, held on flask.g until the app context ends.
+    """
+    conns = g.setdefault('_db_conns', {})
+    conn = conns.get(db_path)
+    if conn is None:
+        conn = _get_pool(db_path).get()
+        if conn is None:
+            conn = connect_db(db_path, check_same_thread=False, isolation_level=None)
+        conns[db_path] = conn
+    return conn
+
+@app.teardown_appcontext
+def release_conns(exc):
+    conns = g.pop('_db_conns', None)
+    if not conns:
+        return
+    for db_path, conn in conns.items():
+        if conn.in_transaction:
+            conn.rollback()
+        _get_pool(db_path).put(conn)
 
 # --- Database Setup ---
-def init_db():
-    if not os.path.exists('vehicles.db'):
-        conn = sqlite3.connect('vehicles.db')
-        c = conn.cursor()
-        c.execute('''
-            CREATE TABLE IF NOT EXISTS images (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                filename TEXT NOT NULL,
-                upload_time TEXT NOT NULL,
-                plate TEXT,
-                is_authorized INTEGER
-            )
-        ''')
-        conn.commit()
-        conn.close()
+@contextmanager
+def schema_lock():
+    """
+    Exclusive lock around startup schema work. Every gunicorn worker imports this module,
+    so without it concurrent workers would run the migrations below at the same time.
+    """
+    if fcntl is None:
+        yield
+        return
+    with open(DB_PATH + '.lock', 'a') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+def migrate_legacy_dbs():
+    """
+    Copy the tables from the old per-table database files into DB_PATH, as-is; the init_*
+    functions then upgrade them like any existing table. Built in a temp file and renamed
+    into place so an interrupted migration is simply retried on the next start.
+    Must be called with schema_lock() held.
+    """
+    # Leftovers from a migration that was killed part-way
+    for stale in glob.glob(glob.escape(DB_PATH) + '.migrating.*'):
+        os.remove(stale)
+    legacy = {table: path for table, path in LEGACY_DB_PATHS.items() if os.path.exists(path)}
+    if os.path.exists(DB_PATH) or not legacy:
+        return
+    tmp_path = f'{DB_PATH}.migrating.{os.getpid()}'
+    conn = sqlite3.connect(tmp_path)
+    for table, path in legacy.items():
+        conn.execute('ATTACH DATABASE ? AS legacy', (path,))
+        row = conn.execute("SELECT sql FROM legacy.sqlite_master WHERE type = 'table' AND name = ?", (table,)).fetchone()
+        if row:
+            conn.execute(row[0])
+            conn.execute(f'INSERT INTO main.{table} SELECT * FROM legacy.{table}')
+            conn.commit()
+        conn.execute('DETACH DATABASE legacy')
+    conn.close()
+    os.replace(tmp_path, DB_PATH)
+    for path in legacy.values():
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+
+# upload_time is stored as Unix epoch microseconds, rendered in local time only for display
+def to_epoch_us(dt):
+    return round(dt.timestamp() * 1_000_000)
+
+def format_upload_time(epoch_us):
+    return datetime.fromtimestamp(epoch_us // 1_000_000).replace(microsecond=epoch_us % 1_000_000).isoformat()
+
+app.add_template_filter(format_upload_time)
+
+IMAGES_TABLE_SQL = '''
+    CREATE TABLE IF NOT EXISTS images (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        filename TEXT NOT NULL,
+        upload_time INTEGER NOT NULL,
+        plate TEXT,
+        is_authorized INTEGER
+    )
+'''
+
+def init_db(conn):
+    c = conn.cursor()
+    # Take the write lock before inspecting the schema, so when several workers start at
+    # once only the first one rebuilds the table and the others see the INTEGER column
+    c.execute('BEGIN IMMEDIATE')
+    column_types = {row[1]: row[2] for row in c.execute('PRAGMA table_info(images)')}
+    if column_types.get('upload_time') == 'TEXT':
+        # Migrate from ISO-8601 text timestamps; the table is rebuilt to change the column type
+        c.execute('ALTER TABLE images RENAME TO images_old')
+        c.execute(IMAGES_TABLE_SQL)
+        rows = c.execute('SELECT id, filename, upload_time, plate, is_authorized FROM images_old').fetchall()
+        c.executemany('INSERT INTO images (id, filename, upload_time, plate, is_authorized) VALUES (?, ?, ?, ?, ?)',
+                      [(i, f, to_epoch_us(datetime.fromisoformat(t)), p, a) for i, f, t, p, a in rows])
+        c.execute('DROP TABLE images_old')
+    c.execute(IMAGES_TABLE_SQL)
+    # Covering index so get_images is an ordered index scan with no sort or table lookups;
+    # id is the tie-breaker for images uploaded in the same microsecond
+    c.execute('DROP INDEX IF EXISTS idx_images_cover')
+    c.execute('''
+        CREATE INDEX IF NOT EXISTS idx_images_page
+        ON images (upload_time DESC, id DESC, filename, plate, is_authorized)
+    ''')
+    conn.commit()
 
-def init_auth_db():
-    if not os.path.exists('auth.db'):
-        conn = sqlite3.connect('auth.db')
-        c = conn.cursor()
+def init_auth_db(conn):
+    c = conn.cursor()
+    c.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'users'")
+    create_needed = c.fetchone() is None
+    if create_needed:
         c.execute('''
             CREATE TABLE IF NOT EXISTS users (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 username TEXT UNIQUE NOT NULL,
-                password TEXT NOT NULL,
+                password_hash TEXT NOT NULL,
                 full_name TEXT NOT NULL,
                 role TEXT DEFAULT 'student',
                 created_at TEXT NOT NULL
@@ -45,9 +260,9 @@ def init_auth_db():
         ''')
         # Add default admin user
         c.execute('''
-            INSERT OR IGNORE INTO users (username, password, full_name, role, created_at)
+            INSERT OR IGNORE INTO users (username, password_hash, full_name, role, created_at)
             VALUES (?, ?, ?, ?, ?)
-        ''', ('admin', 'admin123', 'Administrator', 'admin', datetime.now().isoformat()))
+        ''', ('admin', generate_password_hash('admin123'), 'Administrator', 'admin', datetime.now().isoformat()))
         # Add sample student users
         sample_users = [
             ('student1', 'pass123', 'Rahul Sharma', 'student'),
@@ -55,21 +270,22 @@ def init_auth_db():
             ('faculty1', 'pass123', 'Dr. Amit Kumar', 'faculty'),
         ]
         c.executemany('''
-            INSERT OR IGNORE INTO users (username, password, full_name, role, created_at)
+            INSERT OR IGNORE INTO users (username, password_hash, full_name, role, created_at)
             VALUES (?, ?, ?, ?, ?)
-        ''', [(u[0], u[1], u[2], u[3], datetime.now().isoformat()) for u in sample_users])
-        conn.commit()
-        conn.close()
-
-init_db()
-init_auth_db()
-
-# --- Vehicle Authorization DB (SQLite: vehicle.db) ---
-VEHICLE_DB_PATH = 'vehicle.db'
+        ''', [(u[0], generate_password_hash(u[1]), u[2], u[3], datetime.now().isoformat()) for u in sample_users])
+    else:
+        # Migrate databases created with plaintext passwords: hash them, then blank the old column
+        columns = [row[1] for row in c.execute('PRAGMA table_info(users)')]
+        if 'password_hash' not in columns:
+            c.execute('ALTER TABLE users ADD COLUMN password_hash TEXT')
+        if 'password' in columns:
+            rows = c.execute("SELECT id, password FROM users WHERE password_hash IS NULL OR password_hash = ''").fetchall()
+            c.executemany("UPDATE users SET password_hash = ?, password = '' WHERE id = ?",
+                          [(generate_password_hash(password), user_id) for user_id, password in rows])
+    conn.commit()
 
-def init_vehicle_db():
-    create_needed = not os.path.exists(VEHICLE_DB_PATH)
-    conn = sqlite3.connect(VEHICLE_DB_PATH)
+# --- Vehicle Authorization Table ---
+def init_vehicle_db(conn):
     c = conn.cursor()
     c.execute('''
         CREATE TABLE IF NOT EXISTS vehicles (
@@ -90,26 +306,131 @@ def init_vehicle_db():
             ("UP16ZZ4321", "Vikram Singh", 0),
         ]
         c.executemany('INSERT OR REPLACE INTO vehicles (plate, owner, is_authorized) VALUES (?, ?, ?)', sample_rows)
-        conn.commit()
-    conn.close()
+    conn.commit()
+
+with schema_lock():
+    migrate_legacy_dbs()
+    # One connection for all startup schema work; WAL is persistent, so it only needs setting once
+    schema_conn = connect_db(DB_PATH, timeout=60)
+    schema_conn.execute('PRAGMA journal_mode=WAL')
+    init_db(schema_conn)
+    init_auth_db(schema_conn)
+    init_vehicle_db(schema_conn)
+    schema_conn.close()
+
+# --- Background Image Writer ---
+# Upload records are queued and committed in batches, one transaction (and fsync) per batch
+WRITER_BATCH_SIZE = 64
+WRITER_FLUSH_INTERVAL = 0.02  # seconds
+
+writer_q = queue.Queue()
+
+def _writer_loop():
+    conn = connect_db(DB_PATH, isolation_level=None)
+    while True:
+        rows = [writer_q.get()]
+        deadline = time.monotonic() + WRITER_FLUSH_INTERVAL
+        while len(rows) < WRITER_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                rows.append(writer_q.get(timeout=remaining))
+            except queue.Empty:
+                break
+        # Nothing may escape this loop: if the thread died, uploads would still be
+        # acknowledged but never stored
+        try:
+            _write_batch(conn, rows)
+        except Exception as e:
+            print(f"[ERROR] Image writer dropped {len(rows)} record(s): {e}")
+        finally:
+            for _ in rows:
+                writer_q.task_done()
 
-init_vehicle_db()
+def _write_batch(conn, rows):
+    try:
+        conn.execute('BEGIN IMMEDIATE')
+        conn.executemany(SQL_INSERT_IMAGE, rows)
+        conn.execute('COMMIT')
+    except Exception as e:
+        _rollback_quietly(conn)
+        print(f"[WARNING] Batch insert of {len(rows)} image record(s) failed ({e}); retrying one by one")
+        _insert_rows_individually(conn, rows)
+
+def _rollback_quietly(conn):
+    try:
+        if conn.in_transaction:
+            conn.rollback()
+    except Exception as e:
+        print(f"[ERROR] Rollback of image batch failed: {e}")
+
+def _insert_rows_individually(conn, rows):
+    """
+    Fallback for a failed batch: commit each row on its own so one bad row (or a
+    transient lock timeout) doesn't take the rest of the batch with it.
+    """
+    for row in rows:
+        try:
+            conn.execute(SQL_INSERT_IMAGE, row)
+        except Exception as e:
+            print(f"[ERROR] Failed to save image record {row}: {e}")
+
+threading.Thread(target=_writer_loop, name='image-writer', daemon=True).start()
+
+def flush_sync(timeout=None):
+    """
+    Block until every queued image record has been committed, or `timeout` seconds pass.
+    Returns True if the queue was fully drained.
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    with writer_q.all_tasks_done:
+        while writer_q.unfinished_tasks:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return False
+            writer_q.all_tasks_done.wait(remaining)
+    return True
+
+# The writer is a daemon thread, so drain it before the interpreter exits; otherwise rows
+# for uploads that were already acknowledged would be lost on shutdown or worker restart.
+WRITER_EXIT_TIMEOUT = 10  # seconds
+atexit.register(flush_sync, WRITER_EXIT_TIMEOUT)
 
 # --- Authentication Functions ---
+# Successful logins are remembered briefly so repeat logins skip the (deliberately slow) hash
+# check. The user row is still read on every login, and a cached entry only counts while it
+# matches the stored hash, so password changes, role changes and deletions apply at once.
+LOGIN_CACHE_TTL = 30  # seconds
+_login_cache = {}
+_login_cache_lock = threading.Lock()
+
 def authenticate_user(username, password):
-    conn = sqlite3.connect('auth.db')
+    if not username or not password:
+        return None
+    conn = get_conn(DB_PATH)
     c = conn.cursor()
-    c.execute('SELECT id, username, full_name, role FROM users WHERE username = ? AND password = ?', (username, password))
+    c.execute(SQL_SELECT_USER, (username,))
     user = c.fetchone()
-    conn.close()
-    if user:
-        return {
-            'id': user[0],
-            'username': user[1],
-            'full_name': user[2],
-            'role': user[3]
-        }
-    return None
+    if not user or not user[4]:
+        return None
+    password_hash = user[4]
+    digest = hashlib.sha256(password.encode()).digest()
+    with _login_cache_lock:
+        cached = _login_cache.get(username)
+    verified = (cached is not None and cached[0] > time.monotonic() and cached[2] == password_hash
+                and hmac.compare_digest(cached[1], digest))
+    if not verified:
+        if not check_password_hash(password_hash, password):
+            return None
+        with _login_cache_lock:
+            _login_cache[username] = (time.monotonic() + LOGIN_CACHE_TTL, digest, password_hash)
+    return {
+        'id': user[0],
+        'username': user[1],
+        'full_name': user[2],
+        'role': user[3]
+    }
 
 def login_required(f):
     @wraps(f)
@@ -121,18 +442,133 @@ def login_required(f):
 
 # --- Core Logic Functions ---
 
-def verify_vehicle(license_plate):
+# Upper bound on plates per IN (...) query, well under SQLite's variable limit
+MAX_BATCH_PLATES = 256
+
+@lru_cache(maxsize=MAX_BATCH_PLATES)
+def _select_vehicles_sql(count):
+    return SQL_SELECT_VEHICLES_IN.format(",".join("?" * count))
+
+def _query_plates(conn, plates):
     """
-    Lookup the license plate in SQLite vehicle.db and return authorization info.
+    Fetch distinct normalized plates with a single IN (...) query.
+    Returns {plate: (owner, is_authorized)} for the registered ones.
     """
-    clean_plate = license_plate.strip().upper().replace(" ", "")
-    conn = sqlite3.connect(VEHICLE_DB_PATH)
     c = conn.cursor()
-    c.execute('SELECT owner, is_authorized FROM vehicles WHERE plate = ?', (clean_plate,))
-    row = c.fetchone()
-    conn.close()
+    c.execute(_select_vehicles_sql(len(plates)), plates)
+    return {plate: (owner, int(is_auth)) for plate, owner, is_auth in c.fetchall()}
+
+class PlateLoader:
+    """
+    Coalesces concurrent single-plate lookups: keys requested within the same short
+    window are resolved together by one IN (...) query on a background thread.
+    """
+
+    def __init__(self, db_path, window=0.002):
+        self.db_path = db_path
+        self.window = window
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        threading.Thread(target=self._run, name='plate-loader', daemon=True).start()
+
+    def load(self, clean_plate):
+        """
+        Return a Future resolving to (owner, is_authorized) or None.
+        """
+        with self._lock:
+            future = self._pending.get(clean_plate)
+            if future is None:
+                future = self._pending[clean_plate] = Future()
+                self._wakeup.set()
+        return future
+
+    def _run(self):
+        conn = connect_db(self.db_path)
+        while True:
+            self._wakeup.wait()
+            time.sleep(self.window)
+            with self._lock:
+                pending, self._pending = self._pending, {}
+                self._wakeup.clear()
+            plates = list(pending)
+            try:
+                rows = {}
+                for i in range(0, len(plates), MAX_BATCH_PLATES):
+                    rows.update(_query_plates(conn, plates[i:i + MAX_BATCH_PLATES]))
+            except sqlite3.Error as e:
+                for future in pending.values():
+                    future.set_exception(e)
+                continue
+            for plate, future in pending.items():
+                future.set_result(rows.get(plate))
+
+plate_loader = PlateLoader(DB_PATH)
+PLATE_LOADER_TIMEOUT = 0.05  # seconds
+
+# Registered plates are cached per process for PLATE_CACHE_TTL, which bounds how long any
+# worker keeps serving a changed or removed vehicle row. Unknown plates are never cached,
+# so a newly added vehicle is recognised on its next scan.
+PLATE_CACHE_TTL = 60  # seconds
+PLATE_CACHE_MAX = 4096
+_plate_cache = {}
+_plate_cache_lock = threading.Lock()
+
+def clear_plate_cache():
+    with _plate_cache_lock:
+        _plate_cache.clear()
+
+def _lookup_plate(clean_plate):
+    """
+    Return (owner, is_authorized) for a normalized plate, or None if it is not registered.
+    """
+    now = time.monotonic()
+    with _plate_cache_lock:
+        cached = _plate_cache.get(clean_plate)
+    if cached and cached[0] > now:
+        return cached[1]
+    try:
+        row = plate_loader.load(clean_plate).result(timeout=PLATE_LOADER_TIMEOUT)
+    except FutureTimeout:
+        # Loader is backed up; don't make the request wait on it
+        row = _query_plates(get_conn(DB_PATH), [clean_plate]).get(clean_plate)
+    if row is not None:
+        with _plate_cache_lock:
+            if len(_plate_cache) >= PLATE_CACHE_MAX:
+                _plate_cache.clear()
+            _plate_cache[clean_plate] = (now + PLATE_CACHE_TTL, row)
+    return row
+
+def _lookup_plates(clean_plates):
+    """
+    Fetch many normalized plates on the request's pooled connection.
+    """
+    return _query_plates(get_conn(DB_PATH), list(dict.fromkeys(clean_plates)))
+
+# Uppercases ASCII letters and drops whitespace in a single pass
+_PLATE_TABLE = str.maketrans(string.ascii_lowercase, string.ascii_uppercase, " \t\r\n")
+
+def normalize_plate(license_plate):
+    return license_plate.translate(_PLATE_TABLE)
+
+def verify_vehicle(license_plate):
+    """
+    Lookup the license plate in the SQLite vehicles table and return authorization info.
+    """
+    return _verify_clean(normalize_plate(license_plate))
+
+def _verify_clean(clean_plate):
+    """
+    verify_vehicle() for a plate that has already been through normalize_plate().
+    """
+    return vehicle_result(clean_plate, _lookup_plate(clean_plate))
+
+def vehicle_result(clean_plate, row):
+    """
+    Build the scan response for a plate from its (owner, is_authorized) row, or None if unknown.
+    """
     if row:
-        owner, is_auth = row[0], int(row[1])
+        owner, is_auth = row
         return {
             "is_authorized": bool(is_auth),
             "plate": clean_plate,
@@ -150,29 +586,123 @@ def verify_vehicle(license_plate):
             "alert_type": "error",
         }
 
+def _stream_fileno(stream):
+    """
+    Return the OS file descriptor behind an upload stream, or None if it is held in memory.
+    """
+    # _rolled is private; if it ever disappears, fall back to asking for the fileno,
+    # which rolls the spool over to disk (correct, just slower)
+    if isinstance(stream, tempfile.SpooledTemporaryFile) and not getattr(stream, '_rolled', True):
+        return None
+    try:
+        return stream.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return None
+
+def _write_upload(file, filepath):
+    """
+    Write an uploaded file to disk, copying in-kernel with copy_file_range when the
+    upload has been spooled to a temp file, otherwise with a plain buffered copy.
+    """
+    src = file.stream
+    src_fd = _stream_fileno(src) if hasattr(os, 'copy_file_range') else None
+    dst_fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    with os.fdopen(dst_fd, 'wb') as dst:
+        if src_fd is not None:
+            src.flush()
+            offset = src.tell()
+            remaining = os.fstat(src_fd).st_size - offset
+            try:
+                while remaining > 0:
+                    copied = os.copy_file_range(src_fd, dst_fd, remaining, offset)
+                    if copied == 0:
+                        # Some filesystems report 0 instead of failing; finish in userspace
+                        break
+                    offset += copied
+                    remaining -= copied
+            except OSError as e:
+                # e.g. EXDEV when the temp dir is on a different filesystem; finish in userspace
+                if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+                    raise
+            if remaining <= 0:
+                return
+            src.seek(offset)
+        shutil.copyfileobj(src, dst, 1 << 20)
+
+_FILENAME_RE = re.compile(r'[^A-Za-z0-9_.-]')
+
+def fast_secure_filename(name):
+    """
+    secure_filename() for the common case: plain ASCII names are sanitized with one regex
+    pass; anything else (non-ASCII, leading dots) goes through Werkzeug's full version.
+    """
+    if name.isascii() and not name.startswith('.'):
+        return _FILENAME_RE.sub('_', name)[:255]
+    return secure_filename(name)
+
 def save_image(file, plate, is_authorized):
-    filename = secure_filename(file.filename)
-    if not os.path.exists(app.config['UPLOAD_FOLDER']):
-        os.makedirs(app.config['UPLOAD_FOLDER'])
+    filename = fast_secure_filename(file.filename)
     filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-    file.save(filepath)
-    conn = sqlite3.connect('vehicles.db')
-    c = conn.cursor()
-    c.execute('''
-        INSERT INTO images (filename, upload_time, plate, is_authorized)
-        VALUES (?, ?, ?, ?)
-    ''', (filename, datetime.now().isoformat(), plate, int(is_authorized)))
-    conn.commit()
-    conn.close()
+    _write_upload(file, filepath)
+    writer_q.put((filename, time.time_ns() // 1000, plate, int(is_authorized)))
     return filename
 
-def get_images():
-    conn = sqlite3.connect('vehicles.db')
+IMAGES_PAGE_SIZE = 50
+MAX_IMAGES_PAGE_SIZE = 200
+
+def get_images(limit=IMAGES_PAGE_SIZE, before=None):
+    """
+    Return up to `limit` (filename, upload_time, plate, is_authorized, id) rows, newest first.
+    `before` is an (upload_time, id) cursor; only rows strictly older than it are returned.
+    """
+    return _cached_images(limit, before, _images_generation())
+
+@lru_cache(maxsize=64)
+def _cached_images(limit, before, generation):
+    conn = get_conn(DB_PATH)
     c = conn.cursor()
-    c.execute('SELECT filename, upload_time, plate, is_authorized FROM images ORDER BY upload_time DESC')
-    images = c.fetchall()
-    conn.close()
-    return images
+    if before is None:
+        c.execute(SQL_SELECT_IMAGES, (limit,))
+    else:
+        c.execute(SQL_SELECT_IMAGES_BEFORE, (*before, limit))
+    return tuple(c.fetchall())
+
+def next_images_cursor(images, limit):
+    """
+    Opaque "<upload_time>:<id>" cursor for the page after `images`, or None on the last page.
+    """
+    if len(images) < limit:
+        return None
+    _, upload_time, _, _, image_id = images[-1]
+    return f"{upload_time}:{image_id}"
+
+def parse_images_cursor(cursor):
+    """
+    Inverse of next_images_cursor(); raises ValueError for malformed cursors.
+    """
+    upload_time, image_id = cursor.split(':')
+    return int(upload_time), int(image_id)
+
+def get_image_stats():
+    return _cached_image_stats(_images_generation())
+
+def _images_generation():
+    """
+    Cache key for image query results. Images are only ever appended, so the newest id
+    changes whenever any process (or worker) commits an upload; reading it is a single
+    rowid B-tree descent, far cheaper than the queries it guards.
+    """
+    c = get_conn(DB_PATH).cursor()
+    c.execute(SQL_IMAGES_MAX_ID)
+    return c.fetchone()[0]
+
+@lru_cache(maxsize=4)
+def _cached_image_stats(generation):
+    conn = get_conn(DB_PATH)
+    c = conn.cursor()
+    c.execute(SQL_IMAGE_STATS)
+    total, authorized = c.fetchone()
+    return {'total': total, 'authorized': authorized}
 
 # --- Flask Routes ---
 
@@ -184,12 +714,14 @@ def index():
     if 'user_id' not in session:
         return render_template('login.html')
     images = get_images()
+    stats = get_image_stats()
     user = {
         'username': session.get('username'),
         'full_name': session.get('full_name'),
         'role': session.get('role')
     }
-    return render_template('index.html', images=images, user=user)
+    next_cursor = next_images_cursor(images, IMAGES_PAGE_SIZE)
+    return render_template('index.html', images=images, stats=stats, next_cursor=next_cursor, user=user)
 
 @app.route('/login', methods=['GET', 'POST'])
 def login():
@@ -227,17 +759,47 @@ def scan_vehicle():
     API endpoint to handle the vehicle scan request (triggered by the web interface).
     """
     data = request.get_json()
-    license_plate = data.get('license_plate', '').strip()
-    if not license_plate:
+    plate = (data.get('license_plate') or '').translate(_PLATE_TABLE)
+    if not plate:
         return jsonify({
             "is_authorized": False,
             "message": "Error: No license plate detected.",
             "alert_type": "warning"
         }), 400
-    result = verify_vehicle(license_plate)
+    result = _verify_clean(plate)
     print(f"[{result['alert_type'].upper()}] Vehicle Scanned: {result['plate']} at {request.host_url}scan") 
     return jsonify(result)
 
+@app.route('/scan/batch', methods=['POST'])
+@login_required
+def scan_batch():
+    """
+    API endpoint to verify several license plates in one request and one query.
+    """
+    data = request.get_json(silent=True)
+    plates = data.get('plates') if isinstance(data, dict) else None
+    if not isinstance(plates, list) or not plates:
+        return jsonify({
+            "message": "Error: No license plates provided.",
+            "alert_type": "warning"
+        }), 400
+    if len(plates) > MAX_BATCH_PLATES:
+        return jsonify({
+            "message": f"Error: At most {MAX_BATCH_PLATES} plates per batch.",
+            "alert_type": "warning"
+        }), 400
+    clean_plates = [normalize_plate(plate) if isinstance(plate, str) else '' for plate in plates]
+    if not all(clean_plates):
+        return jsonify({
+            "message": "Error: No license plate detected for one or more entries.",
+            "alert_type": "warning"
+        }), 400
+    rows = _lookup_plates(clean_plates)
+    results = [vehicle_result(plate, rows.get(plate)) for plate in clean_plates]
+    for result in results:
+        print(f"[{result['alert_type'].upper()}] Vehicle Scanned: {result['plate']} at {request.host_url}scan/batch")
+    return jsonify({"results": results})
+
 @app.route('/upload', methods=['POST'])
 @login_required
 def upload_image():
@@ -258,16 +820,54 @@ def upload_image():
 @login_required
 def gallery():
     """
-    API endpoint to fetch all images for gallery display.
+    API endpoint to fetch a page of images for gallery display.
+    Pass the returned next_cursor as ?cursor= to get the next page.
     """
-    images = get_images()
-    return jsonify(images)
+    cursor = request.args.get('cursor')
+    before = None
+    if cursor:
+        try:
+            before = parse_images_cursor(cursor)
+        except ValueError:
+            return jsonify({"message": "Invalid cursor"}), 400
+    limit = request.args.get('limit', IMAGES_PAGE_SIZE, type=int)
+    limit = max(1, min(limit, MAX_IMAGES_PAGE_SIZE))
+    images = get_images(limit, before)
+    return jsonify({
+        "images": [(filename, format_upload_time(upload_time), plate, is_authorized)
+                   for filename, upload_time, plate, is_authorized, _ in images],
+        "next_cursor": next_images_cursor(images, limit),
+    })
+
+@app.route('/admin/vehicles/reload', methods=['POST'])
+@login_required
+def reload_vehicles():
+    """
+    Drop this worker process's cached plate lookups so changes made to the vehicles table
+    take effect immediately here. Other workers pick them up within PLATE_CACHE_TTL seconds.
+    """
+    if session.get('role') != 'admin':
+        return jsonify({"message": "Admin access required"}), 403
+    clear_plate_cache()
+    return jsonify({
+        "message": f"Vehicle cache cleared for this worker; other workers refresh within {PLATE_CACHE_TTL} seconds"
+    })
 
 @app.route('/static/uploads/<filename>')
 def uploaded_file(filename):
+    prefix = app.config['X_ACCEL_REDIRECT_PREFIX']
+    if prefix:
+        if safe_join(app.config['UPLOAD_FOLDER'], filename) is None:
+            abort(404)
+        response = app.response_class(mimetype=mimetypes.guess_type(filename)[0] or 'application/octet-stream')
+        response.headers['X-Accel-Redirect'] = f"{prefix.rstrip('/')}/{quote(filename)}"
+        return response
     return send_from_directory(app.config['UPLOAD_FOLDER'], filename)
 
 # --- Application Run ---
+# Development server only. In production run the threaded gunicorn setup in gunicorn.conf.py:
+#     gunicorn app:app
+# (equivalent to: gunicorn -k gthread -w 2 --threads 16 app:app)
 
 if __name__ == '__main__':
-    app.run(debug=True)
\ No newline at end of file
+    app.run(debug=True, threaded=True)
\ No newline at end of file
@@ -0,0 +1,18 @@
+# gunicorn.conf.py
+# Production server settings, picked up automatically by: gunicorn app:app (run from this directory)
+import os
+import sys
+
+workers = int(os.environ.get('GUNICORN_WORKERS', 2))
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 16))
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:8000')
+
+# Each worker process has its own SQLite connection pool; size it to one connection per thread
+raw_env = [f"DB_POOL_SIZE={os.environ.get('DB_POOL_SIZE', threads)}"]
+
+def worker_exit(server, worker):
+    # Commit upload records still queued in this worker before it goes away
+    app_module = sys.modules.get('app')
+    if app_module is not None:
+        app_module.flush_sync(app_module.WRITER_EXIT_TIMEOUT)